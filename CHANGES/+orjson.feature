@@ -0,0 +1 @@
+Encode request bodies and registry auth headers, and decode JSON responses, with orjson when it is installed, available via the new ``aiodocker[fast]`` extra.
@@ -0,0 +1 @@
+Add ``DockerServices.bulk_update()`` to update the image of several services concurrently and report the outcome of each update.
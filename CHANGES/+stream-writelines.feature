@@ -0,0 +1 @@
+``Stream.write_in()`` now also accepts an iterable of byte chunks, which is written with a single vectored ``writelines()`` call.
@@ -0,0 +1 @@
+Add ``DockerSystem.info_cached()`` which reuses the ``docker info`` response for a configurable TTL.
@@ -0,0 +1 @@
+Add ``DockerTasks.inspect_many()`` to inspect several tasks concurrently.
@@ -0,0 +1 @@
+Add a ``hydrate`` flag to ``DockerTasks.list()`` which returns the tasks keyed by their ID.
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-import json
 from base64 import b64encode
 from typing import Any, List, Mapping, Optional, Sequence
 
-from .utils import clean_filters, clean_map
+from .utils import clean_filters, clean_map, encode_json
 
 
 class DockerConfigs:
@@ -29,7 +28,7 @@ class DockerConfigs:
             names=<config name>
         """
 
-        params = {"filters": clean_filters(filters)}
+        params = {} if filters is None else {"filters": clean_filters(filters)}
         response = await self.docker._query_json("configs", method="GET", params=params)
         return response
 
@@ -68,7 +67,7 @@ class DockerConfigs:
             "Templating": templating,
         }
 
-        request_data = json.dumps(clean_map(request))
+        request_data = encode_json(clean_map(request))
         response = await self.docker._query_json(
             "configs/create", method="POST", data=request_data, headers=headers
         )
@@ -146,7 +145,7 @@ class DockerConfigs:
             spec["Templating"] = templating
 
         params = {"version": version}
-        request_data = json.dumps(clean_map(spec))
+        request_data = encode_json(clean_map(spec))
 
         await self.docker._query_json(
             f"configs/{config_id}/update",
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import shlex
 import tarfile
 from contextlib import AbstractAsyncContextManager
@@ -32,7 +31,7 @@ from .logs import DockerLog
 from .multiplexed import multiplexed_result_list, multiplexed_result_stream
 from .stream import Stream
 from .types import PortInfo
-from .utils import identical, parse_result
+from .utils import encode_json, identical, parse_result
 
 
 if TYPE_CHECKING:
@@ -79,7 +78,7 @@ class DockerContainers:
         name: Optional[str] = None,
     ) -> DockerContainer:
         url = "containers/create"
-        encoded_config = json.dumps(config, sort_keys=True).encode("utf-8")
+        encoded_config = encode_json(config, sort_keys=True)
         kwargs = {}
         if name:
             kwargs["name"] = name
@@ -147,8 +146,10 @@ class DockerContainer:
     def __init__(self, docker: Docker, **kwargs) -> None:
         self.docker = docker
         self._container = kwargs
-        self._id = self._container.get(
-            "id", self._container.get("ID", self._container.get("Id"))
+        self._id = (
+            self._container.get("id")
+            or self._container.get("ID")
+            or self._container.get("Id")
         )
         self.logs = DockerLog(docker, self)
 
@@ -321,7 +322,18 @@ class DockerContainer:
         stdin: bool = False,
         detach_keys: Optional[str] = None,
         logs: bool = False,
+        queue_limit: Optional[int] = None,
     ) -> Stream:
+        """
+        Attach to the container's standard streams.
+
+        Args:
+            queue_limit: the flow-control limit of the output buffer; reading
+                from the socket pauses while more than twice this many bytes
+                are unread.  Defaults to 64 KiB for TTY containers and 1 MiB
+                otherwise.
+        """
+
         async def setup() -> Tuple[URL, Optional[bytes], bool]:
             params: MultiDict[Union[str, int]] = MultiDict()
             if detach_keys:
@@ -340,7 +352,7 @@ class DockerContainer:
                 inspect_info["Config"]["Tty"],
             )
 
-        return Stream(self.docker, setup, None)
+        return Stream(self.docker, setup, None, queue_limit=queue_limit)
 
     async def port(self, private_port: int | str) -> List[PortInfo] | None:
         if "NetworkSettings" not in self._container:
@@ -41,7 +41,7 @@ from .swarm import DockerSwarm
 from .system import DockerSystem
 from .tasks import DockerTasks
 from .types import SENTINEL, Sentinel
-from .utils import httpize, parse_result
+from .utils import encode_json, httpize, parse_result
 from .volumes import DockerVolume, DockerVolumes
 
 
@@ -197,11 +197,7 @@ class Docker:
         if isinstance(path, URL):
             assert not path.is_absolute()
         if versioned_api:
-            return URL(
-                "{self.docker_host}/{self.api_version}/{path}".format(
-                    self=self, path=path
-                )
-            )
+            return URL(f"{self.docker_host}/{self.api_version}/{path}")
         else:
             return URL(f"{self.docker_host}/{path}")
 
@@ -319,7 +315,7 @@ class Docker:
             headers = {}
         headers["Content-Type"] = "application/json"
         if data is not None and not isinstance(data, (str, bytes)):
-            data = json.dumps(data)
+            data = encode_json(data)
         async with self._query(
             path,
             method,
@@ -333,6 +329,34 @@ class Docker:
             data = await parse_result(response)
             return data
 
+    async def _query_discard(
+        self,
+        path: Union[str, URL],
+        method: str = "GET",
+        *,
+        params: Optional[JSONObject] = None,
+        data: Optional[Any] = None,
+        headers=None,
+        timeout: Union[float, aiohttp.ClientTimeout, Sentinel, None] = SENTINEL,
+        versioned_api: bool = True,
+    ) -> None:
+        """
+        A shorthand of _query() for requests whose response body is not used.
+        The response is released right away so that its connection is reused.
+        """
+        response = await self._do_query(
+            path=path,
+            method=method,
+            params=params,
+            data=data,
+            headers=headers,
+            timeout=timeout,
+            chunked=None,
+            read_until_eof=True,
+            versioned_api=versioned_api,
+        )
+        response.release()
+
     def _query_chunked_post(
         self,
         path: Union[str, URL],
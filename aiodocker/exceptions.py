@@ -12,10 +12,10 @@ class DockerError(Exception):
         self.message = data["message"]
 
     def __repr__(self) -> str:
-        return "DockerError({self.status}, {self.message!r})".format(self=self)
+        return f"DockerError({self.status}, {self.message!r})"
 
     def __str__(self) -> str:
-        return "DockerError({self.status}, {self.message!r})".format(self=self)
+        return f"DockerError({self.status}, {self.message!r})"
 
 
 class DockerContainerError(DockerError):
@@ -26,13 +26,13 @@ class DockerContainerError(DockerError):
     def __repr__(self) -> str:
         return (
             "DockerContainerError("
-            "{self.status}, {self.message!r}, "
-            "{self.container_id!r})"
-        ).format(self=self)
+            f"{self.status}, {self.message!r}, "
+            f"{self.container_id!r})"
+        )
 
     def __str__(self) -> str:
         return (
             "DockerContainerError("
-            "{self.status}, {self.message!r}, "
-            "{self.container_id!r})"
-        ).format(self=self)
+            f"{self.status}, {self.message!r}, "
+            f"{self.container_id!r})"
+        )
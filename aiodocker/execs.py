@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -29,6 +28,16 @@ if TYPE_CHECKING:
 # Format" heading. Note that that documentation is for "docker attach" but the format
 # also applies to "docker exec."
 
+# Pre-encoded bodies of the "exec start" request keyed by the tty flag.
+_ATTACHED_START_BODY = {
+    False: b'{"Detach": false, "Tty": false}',
+    True: b'{"Detach": false, "Tty": true}',
+}
+_DETACHED_START_BODY = {
+    False: b'{"Detach": true, "Tty": false}',
+    True: b'{"Detach": true, "Tty": true}',
+}
+
 
 class Exec:
     def __init__(self, docker: "Docker", id: str, tty: Optional[bool] = None) -> None:
@@ -64,6 +73,7 @@ class Exec:
         *,
         timeout: Optional[aiohttp.ClientTimeout] = None,
         detach: Literal[False] = False,
+        queue_limit: Optional[int] = None,
     ) -> Stream:
         pass
 
@@ -81,6 +91,7 @@ class Exec:
         *,
         timeout: aiohttp.ClientTimeout | None = None,
         detach: bool = False,
+        queue_limit: Optional[int] = None,
     ) -> Any:
         """
         Start this exec instance.
@@ -90,6 +101,10 @@ class Exec:
                 option to `docker exec`).
             tty: Indicates whether a TTY should be allocated (like the `-t` option to
                 `docker exec`).
+            queue_limit: The flow-control limit of the output buffer; reading from the
+                socket pauses while more than twice this many bytes are unread.
+                Defaults to 64 KiB for TTY sessions and 1 MiB otherwise. Ignored if
+                `detach` is `True`.
         Returns:
             If `detach` is `True`, this method will return the result of the exec
             process as a binary string.
@@ -112,11 +127,11 @@ class Exec:
                 assert self._tty is not None
                 return (
                     URL(f"exec/{self._id}/start"),
-                    json.dumps({"Detach": False, "Tty": self._tty}).encode("utf8"),
+                    _ATTACHED_START_BODY[bool(self._tty)],
                     self._tty,
                 )
 
-            return Stream(self.docker, setup, timeout)
+            return Stream(self.docker, setup, timeout, queue_limit=queue_limit)
 
     async def _start_detached(
         self,
@@ -130,7 +145,7 @@ class Exec:
             f"exec/{self._id}/start",
             method="POST",
             headers={"Content-Type": "application/json"},
-            data=json.dumps({"Detach": True, "Tty": tty}),
+            data=_DETACHED_START_BODY[bool(tty)],
             timeout=timeout,
         ) as response:
             result = await response.read()
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import json
 import logging
-import types
 
 import aiohttp
 
@@ -18,11 +17,10 @@ class _JsonStreamResult:
     def __aiter__(self):
         return self
 
-    @types.coroutine
-    def __anext__(self):
+    async def __anext__(self):
         while True:
             try:
-                data = yield from self._response.content.readline()
+                data = await self._response.content.readline()
                 if not data:
                     break
             except (aiohttp.ClientConnectionError, aiohttp.ServerDisconnectedError):
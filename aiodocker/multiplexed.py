@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import asyncio
 import struct
-import types
 
 import aiohttp
 
@@ -31,18 +30,17 @@ class MultiplexedResult:
 
         return response
 
-    @types.coroutine
-    def fetch(self):
+    async def fetch(self):
         while True:
             try:
                 hdrlen = constants.STREAM_HEADER_SIZE_BYTES
-                header = yield from self._response.content.readexactly(hdrlen)
+                header = await self._response.content.readexactly(hdrlen)
 
                 _, length = struct.unpack(">BxxxL", header)
                 if not length:
                     continue
 
-                data = yield from self._response.content.readexactly(length)
+                data = await self._response.content.readexactly(length)
 
             except (
                 aiohttp.ClientConnectionError,
@@ -52,12 +50,11 @@ class MultiplexedResult:
                 break
             return data
 
-    @types.coroutine
-    def fetch_raw(self):
+    async def fetch_raw(self):
         chunk = self._response.content.iter_chunked(1024).__aiter__()
         while True:
             try:
-                data = yield from chunk.__anext__()
+                data = await chunk.__anext__()
             except StopAsyncIteration:
                 break
             return data
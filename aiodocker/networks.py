@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-import json
 from typing import Any, Dict, List, Mapping, Optional, Sequence
 
-from .utils import clean_filters
+from .utils import clean_filters, encode_json
 
 
 class DockerNetworks:
@@ -36,7 +35,7 @@ class DockerNetworks:
         return data
 
     async def create(self, config: Dict[str, Any]) -> DockerNetwork:
-        bconfig = json.dumps(config, sort_keys=True).encode("utf-8")
+        bconfig = encode_json(config, sort_keys=True)
         data = await self.docker._query_json(
             "networks/create", method="POST", data=bconfig
         )
@@ -61,13 +60,13 @@ class DockerNetwork:
             return resp.status == 204
 
     async def connect(self, config: Dict[str, Any]) -> None:
-        bconfig = json.dumps(config, sort_keys=True).encode("utf-8")
+        bconfig = encode_json(config, sort_keys=True)
         await self.docker._query_json(
             f"networks/{self.id}/connect", method="POST", data=bconfig
         )
 
     async def disconnect(self, config: Dict[str, Any]) -> None:
-        bconfig = json.dumps(config, sort_keys=True).encode("utf-8")
+        bconfig = encode_json(config, sort_keys=True)
         await self.docker._query_json(
             f"networks/{self.id}/disconnect",
             method="POST",
@@ -28,7 +28,7 @@ class DockerSwarmNodes:
             role=(manager|worker)`
         """
 
-        params = {"filters": clean_filters(filters)}
+        params = {} if filters is None else {"filters": clean_filters(filters)}
 
         response = await self.docker._query_json("nodes", method="GET", params=params)
 
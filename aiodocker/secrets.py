@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-import json
 from base64 import b64encode
 from typing import Any, List, Mapping, Optional, Sequence
 
-from .utils import clean_filters, clean_map
+from .utils import clean_filters, clean_map, encode_json
 
 
 class DockerSecrets:
@@ -29,7 +28,7 @@ class DockerSecrets:
             names=<secret name>
         """
 
-        params = {"filters": clean_filters(filters)}
+        params = {} if filters is None else {"filters": clean_filters(filters)}
         response = await self.docker._query_json("secrets", method="GET", params=params)
         return response
 
@@ -60,7 +59,7 @@ class DockerSecrets:
 
         b64_data = None
         if data is not None:
-            b64_data = data if b64 else b64encode(data.encode()).decode()
+            b64_data = data if b64 else b64encode(data.encode()).decode("ascii")
 
         headers = None
         request = {
@@ -71,7 +70,7 @@ class DockerSecrets:
             "Templating": templating,
         }
 
-        request_data = json.dumps(clean_map(request))
+        request_data = encode_json(clean_map(request))
         response = await self.docker._query_json(
             "secrets/create", method="POST", data=request_data, headers=headers
         )
@@ -138,7 +137,7 @@ class DockerSecrets:
 
         b64_data = None
         if data is not None:
-            b64_data = data if b64 else b64encode(data.encode()).decode()
+            b64_data = data if b64 else b64encode(data.encode()).decode("ascii")
             spec["Data"] = b64_data
 
         if name is not None:
@@ -154,7 +153,7 @@ class DockerSecrets:
             spec["Templating"] = templating
 
         params = {"version": version}
-        request_data = json.dumps(clean_map(spec))
+        request_data = encode_json(clean_map(spec))
 
         await self.docker._query_json(
             f"secrets/{secret_id}/update",
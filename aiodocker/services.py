@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import itertools
 from typing import (
     Any,
     AsyncIterator,
+    Dict,
     List,
     Mapping,
     MutableMapping,
@@ -15,9 +17,9 @@ from typing import (
 from .multiplexed import multiplexed_result_list, multiplexed_result_stream
 from .utils import (
     clean_filters,
-    clean_map,
     clean_networks,
     compose_auth_header,
+    encode_json,
     format_env,
 )
 
@@ -44,7 +46,7 @@ class DockerServices:
             name=<service name>
         """
 
-        params = {"filters": clean_filters(filters)}
+        params = {} if filters is None else {"filters": clean_filters(filters)}
 
         response = await self.docker._query_json(
             "services", method="GET", params=params
@@ -94,28 +96,33 @@ class DockerServices:
             )
 
         # from {"key":"value"} to ["key=value"]
-        if "Env" in task_template["ContainerSpec"]:
-            task_template["ContainerSpec"]["Env"] = [
-                format_env(k, v)
-                for k, v in task_template["ContainerSpec"]["Env"].items()
-            ]
+        # (already converted lists, e.g. from a reused task_template, are kept)
+        container_spec = task_template["ContainerSpec"]
+        env = container_spec.get("Env")
+        if isinstance(env, Mapping):
+            container_spec["Env"] = list(itertools.starmap(format_env, env.items()))
 
         headers = None
         if auth:
             headers = {"X-Registry-Auth": compose_auth_header(auth, registry)}
 
+        # build the config without the None values in a single pass
         config = {
-            "TaskTemplate": task_template,
-            "Name": name,
-            "Labels": labels,
-            "Mode": mode,
-            "UpdateConfig": update_config,
-            "RollbackConfig": rollback_config,
-            "Networks": clean_networks(networks),
-            "EndpointSpec": endpoint_spec,
+            k: v
+            for k, v in (
+                ("TaskTemplate", task_template),
+                ("Name", name),
+                ("Labels", labels),
+                ("Mode", mode),
+                ("UpdateConfig", update_config),
+                ("RollbackConfig", rollback_config),
+                ("Networks", clean_networks(networks)),
+                ("EndpointSpec", endpoint_spec),
+            )
+            if v is not None
         }
 
-        data = json.dumps(clean_map(config))
+        data = encode_json(config)
 
         response = await self.docker._query_json(
             "services/create", method="POST", data=data, headers=headers
@@ -155,7 +162,62 @@ class DockerServices:
         if rollback is True:
             params["rollback"] = "previous"
 
-        data = json.dumps(clean_map(spec))
+        await self._update_spec(service_id, spec, params)
+        return True
+
+    async def bulk_update(
+        self,
+        images: Mapping[str, str],
+        *,
+        versions: Optional[Mapping[str, int]] = None,
+        concurrency: int = 10,
+    ) -> Dict[str, Optional[BaseException]]:
+        """
+        Update the image of several services concurrently.
+
+        A failed update does not stop the others; every service is attempted
+        and its outcome is reported in the returned mapping.
+
+        Args:
+            images: a mapping of service IDs or names to their new image.
+            versions: versions of the services that you want to update,
+                must cover every service in ``images``.  Defaults to
+                the versions returned by inspecting them.
+            concurrency: maximum number of services updated at the same time.
+
+        Returns:
+            A mapping of the given service IDs or names to ``None`` if
+            the service was updated, or to the exception raised otherwise.
+        """
+        if versions is not None:
+            missing = sorted(images.keys() - versions.keys())
+            if missing:
+                raise ValueError(f"Missing versions for services: {missing}")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _update_one(service_id: str, image: str) -> None:
+            async with semaphore:
+                inspect_service = await self.inspect(service_id)
+                if versions is None:
+                    version = inspect_service["Version"]["Index"]
+                else:
+                    version = versions[service_id]
+                spec = inspect_service["Spec"]
+                spec["TaskTemplate"]["ContainerSpec"]["Image"] = image
+                await self._update_spec(service_id, spec, {"version": version})
+
+        results = await asyncio.gather(
+            *(_update_one(service_id, image) for service_id, image in images.items()),
+            return_exceptions=True,
+        )
+        return dict(zip(images, results))
+
+    async def _update_spec(
+        self, service_id: str, spec: Mapping[str, Any], params: Mapping[str, Any]
+    ) -> None:
+        # the spec comes from the engine's inspect output and has no null fields
+        data = encode_json(spec)
 
         await self.docker._query_json(
             f"services/{service_id}/update",
@@ -163,7 +225,6 @@ class DockerServices:
             data=data,
             params=params,
         )
-        return True
 
     async def delete(self, service_id: str) -> bool:
         """
@@ -1,10 +1,26 @@
 from __future__ import annotations
 
+import asyncio
+import collections
+import functools
 import socket
 import struct
 import warnings
+import weakref
 from types import TracebackType
-from typing import TYPE_CHECKING, Awaitable, Callable, NamedTuple, Optional, Tuple, Type
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    Deque,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 import aiohttp
 from yarl import URL
@@ -13,6 +29,8 @@ from .exceptions import DockerError
 
 
 if TYPE_CHECKING:
+    from aiohttp.client_proto import ResponseHandler
+
     from .docker import Docker
 
 
@@ -21,6 +39,11 @@ class Message(NamedTuple):
     data: bytes
 
 
+# builds a Message from a (stream, data) tuple without going through the
+# Python-level __new__ generated for named tuples; used once per frame
+_new_message = functools.partial(tuple.__new__, Message)
+
+
 class Stream:
     _resp: aiohttp.ClientResponse | None
 
@@ -29,13 +52,20 @@ class Stream:
         docker: "Docker",
         setup: Callable[[], Awaitable[Tuple[URL, Optional[bytes], bool]]],
         timeout: Optional[aiohttp.ClientTimeout],
+        *,
+        queue_limit: Optional[int] = None,
     ) -> None:
         self._setup = setup
         self.docker = docker
         self._resp = None
         self._closed = False
         self._timeout = timeout
-        self._queue: Optional[aiohttp.FlowControlDataQueue[Message]] = None
+        self._queue_limit = queue_limit
+        self._queue: Optional[_MessageQueue] = None
+        self._transport: Optional[asyncio.Transport] = None
+        self._protocol: Optional[ResponseHandler] = None
+        self._write_low_water = 0
+        self._finalizer: Optional[weakref.finalize] = None
 
     async def _init(self) -> None:
         if self._resp is not None:
@@ -57,9 +87,11 @@ class Stream:
             versioned_api=True,
         )
         # read body if present, it can contain an information
-        # about disconnection
-        assert self._resp is not None
-        body = await self._resp.read()
+        # about disconnection; a hijacked upgrade response has no payload,
+        # so skip the read entirely when the content is already exhausted
+        body = b""
+        if not resp.content.at_eof():
+            body = await resp.read()
 
         conn = resp.connection
         if conn is None:
@@ -79,7 +111,6 @@ class Stream:
                 {"message": msg},
             )
         protocol = conn.protocol
-        loop = resp._loop
         assert protocol is not None
         assert protocol.transport is not None
         sock = protocol.transport.get_extra_info("socket")
@@ -87,36 +118,60 @@ class Stream:
             # set TCP keepalive for vendored socket
             # the socket can be closed in the case of error
             sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if sock.family in (socket.AF_INET, socket.AF_INET6):
+                # don't delay small interactive writes (Nagle's algorithm)
+                try:
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                except OSError:
+                    pass
 
-        queue: aiohttp.FlowControlDataQueue[Message] = aiohttp.FlowControlDataQueue(
-            protocol, limit=2**16, loop=loop
-        )
+        queue_limit = self._queue_limit
+        if queue_limit is None:
+            # keep interactive tty sessions responsive and let multiplexed
+            # (e.g. log-heavy) streams buffer more before pausing the socket
+            queue_limit = 2**16 if tty else 2**20
+        queue = _MessageQueue(protocol, queue_limit)
         protocol.set_parser(_ExecParser(queue, tty=tty), queue)
         protocol.force_close()
         self._queue = queue
+        self._transport = protocol.transport
+        self._protocol = protocol
+        self._write_low_water = protocol.transport.get_write_buffer_limits()[0]
+        # only streams which have opened a connection need to be closed
+        self._finalizer = weakref.finalize(self, _warn_unclosed)
+        self._finalizer.atexit = False
 
     async def read_out(self) -> Optional[Message]:
         """Read from stdout or stderr."""
         await self._init()
-        try:
-            assert self._queue is not None
-            return await self._queue.read()
-        except aiohttp.EofStream:
-            return None
-
-    async def write_in(self, data: bytes) -> None:
-        """Write into stdin."""
+        assert self._queue is not None
+        return await self._queue.read()
+
+    async def write_in(
+        self, data: Union[bytes, bytearray, memoryview, Iterable[bytes]]
+    ) -> None:
+        """
+        Write into stdin.
+
+        An iterable of chunks is passed to the transport as a single vectored
+        write, which avoids joining them first (without any copy on
+        Python 3.12+).
+        """
         if self._closed:
             raise RuntimeError("Cannot write to closed transport")
         await self._init()
-        assert self._resp is not None
-        assert self._resp.connection is not None
-        transport = self._resp.connection.transport
-        assert transport is not None
-        transport.write(data)
-        protocol = self._resp.connection.protocol
-        assert protocol is not None
-        if protocol.transport is not None:
+        transport = self._transport
+        protocol = self._protocol
+        assert transport is not None and protocol is not None
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            transport.write(data)
+        else:
+            transport.writelines(data)
+        # writing can only be paused while the buffer is above the low-water mark
+        if (
+            transport.get_write_buffer_size() > self._write_low_water
+            and protocol.transport is not None
+        ):
             await protocol._drain_helper()
 
     async def close(self) -> None:
@@ -125,6 +180,8 @@ class Stream:
         if self._closed:
             return
         self._closed = True
+        if self._finalizer is not None:
+            self._finalizer.detach()
         assert self._resp.connection is not None
         transport = self._resp.connection.transport
         if transport and transport.can_write_eof():
@@ -144,19 +201,79 @@ class Stream:
         await self.close()
         return None
 
-    def __del__(self, _warnings=warnings) -> None:
-        if self._resp is not None:
-            return
-        if not self._closed:
-            warnings.warn("Unclosed ExecStream", ResourceWarning)
+
+class _MessageQueue:
+    """Single-consumer queue of parsed messages.
+
+    Reading from the socket is paused while the queued payloads exceed twice
+    the limit, the same thresholds as aiohttp's ``FlowControlDataQueue``.
+    """
+
+    __slots__ = ("_protocol", "_limit", "_size", "_buffer", "_event", "_eof", "_exc")
+
+    def __init__(self, protocol: ResponseHandler, limit: int) -> None:
+        self._protocol = protocol
+        self._limit = limit * 2
+        self._size = 0
+        self._buffer: Deque[Tuple[Message, int]] = collections.deque()
+        self._event = asyncio.Event()
+        self._eof = False
+        self._exc: Optional[BaseException] = None
+
+    def is_eof(self) -> bool:
+        return self._eof
+
+    def feed_data(self, msg: Message, size: int) -> None:
+        self._buffer.append((msg, size))
+        self._size += size
+        if self._size > self._limit and not self._protocol._reading_paused:
+            self._protocol.pause_reading()
+        self._event.set()
+
+    def feed_eof(self) -> None:
+        self._eof = True
+        self._event.set()
+
+    def set_exception(self, exc: BaseException) -> None:
+        self._eof = True
+        self._exc = exc
+        self._event.set()
+
+    async def read(self) -> Optional[Message]:
+        while not self._buffer:
+            if self._eof:
+                if self._exc is not None:
+                    raise self._exc
+                return None
+            self._event.clear()
+            await self._event.wait()
+        msg, size = self._buffer.popleft()
+        self._size -= size
+        if self._size < self._limit and self._protocol._reading_paused:
+            self._protocol.resume_reading()
+        return msg
+
+
+# Docker multiplexed stream frame header: stream type, 3 padding bytes, size
+_HEADER = struct.Struct(">BxxxL")
+_HEADER_SIZE = _HEADER.size
+
+
+def _warn_unclosed() -> None:
+    warnings.warn("Unclosed ExecStream", ResourceWarning)
 
 
 class _ExecParser:
     def __init__(self, queue, tty=False) -> None:
         self.queue = queue
         self.tty = tty
-        self.header_fmt = struct.Struct(">BxxxL")
         self._buf = bytearray()
+        # offset of the first unparsed byte in self._buf
+        self._read_pos = 0
+        # pick the implementation once instead of branching on every chunk
+        self.feed_data: Callable[[bytes], Tuple[bool, bytes]] = (
+            self._feed_tty if tty else self._feed_multiplexed
+        )
 
     def set_exception(self, exc: BaseException) -> None:
         self.queue.set_exception(exc)
@@ -164,25 +281,66 @@ class _ExecParser:
     def feed_eof(self) -> None:
         self.queue.feed_eof()
 
-    def feed_data(self, data: bytes) -> Tuple[bool, bytes]:
-        if self.tty:
-            msg = Message(1, data)  # stdout
-            self.queue.feed_data(msg, len(data))
+    def _feed_frames(
+        self, view: memoryview, fileno: int, spans: List[Tuple[int, int]]
+    ) -> None:
+        if len(spans) == 1:
+            start, end = spans[0]
+            payload = bytes(view[start:end])
+        else:
+            payload = b"".join([view[start:end] for start, end in spans])
+        spans.clear()
+        self.queue.feed_data(_new_message((fileno, payload)), len(payload))
+
+    def _feed_tty(self, data: bytes) -> Tuple[bool, bytes]:
+        self.queue.feed_data(_new_message((1, data)), len(data))  # stdout
+        return False, b""
+
+    def _feed_multiplexed(self, data: bytes) -> Tuple[bool, bytes]:
+        buf = self._buf
+        src: Union[bytes, bytearray]
+        if buf:
+            buf.extend(data)
+            src = buf
         else:
-            self._buf.extend(data)
-            while self._buf:
+            # nothing is pending: parse the chunk in place and buffer
+            # only its incomplete tail, saving a copy of every payload
+            src = data
+        srclen = len(src)
+        hdrlen = _HEADER_SIZE
+        unpack_header = _HEADER.unpack_from
+        pos = self._read_pos
+        # consecutive frames of the same stream are merged into a single
+        # message, so chatty output does not wake the reader per frame
+        pending_fileno = -1
+        spans: List[Tuple[int, int]] = []
+        # slicing the view copies each payload once instead of twice;
+        # it must be released before the buffer is resized below
+        with memoryview(src) as view:
+            while srclen - pos >= hdrlen:
                 # Parse the header
-                if len(self._buf) < self.header_fmt.size:
-                    return False, b""
-                fileno, msglen = self.header_fmt.unpack(
-                    self._buf[: self.header_fmt.size]
-                )
-                msg_and_header = self.header_fmt.size + msglen
-                if len(self._buf) < msg_and_header:
-                    return False, b""
-                msg = Message(
-                    fileno, bytes(self._buf[self.header_fmt.size : msg_and_header])
-                )
-                self.queue.feed_data(msg, msglen)
-                del self._buf[:msg_and_header]
+                fileno, msglen = unpack_header(src, pos)
+                msg_and_header = hdrlen + msglen
+                if srclen - pos < msg_and_header:
+                    break
+                if fileno != pending_fileno and spans:
+                    self._feed_frames(view, pending_fileno, spans)
+                pending_fileno = fileno
+                spans.append((pos + hdrlen, pos + msg_and_header))
+                pos += msg_and_header
+            if spans:
+                self._feed_frames(view, pending_fileno, spans)
+            if src is not buf:
+                buf += view[pos:]
+                pos = 0
+        # Drop the consumed prefix only when it is worth the memmove
+        # instead of shifting the buffer after every frame.
+        if src is buf:
+            if pos == srclen:
+                buf.clear()
+                pos = 0
+            elif pos > 65536 or pos * 2 > srclen:
+                del buf[:pos]
+                pos = 0
+        self._read_pos = pos
         return False, b""
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Iterable, Mapping, Optional
 
-from .utils import clean_map
+from .utils import encode_json, prune_none_inplace
 
 
 class DockerSwarm:
@@ -46,7 +46,9 @@ class DockerSwarm:
             "Spec": swarm_spec,
         }
 
-        response = await self.docker._query_json("swarm/init", method="POST", data=data)
+        response = await self.docker._query_json(
+            "swarm/init", method="POST", data=prune_none_inplace(data)
+        )
 
         return response
 
@@ -92,17 +94,23 @@ class DockerSwarm:
         """
 
         data = {
-            "RemoteAddrs": list(remote_addrs),
+            # the list is only serialized, so a caller's list is not copied
+            "RemoteAddrs": (
+                remote_addrs if isinstance(remote_addrs, list) else list(remote_addrs)
+            ),
             "JoinToken": join_token,
             "ListenAddr": listen_addr,
             "AdvertiseAddr": advertise_addr,
             "DataPathAddr": data_path_addr,
         }
 
-        async with self.docker._query(
-            "swarm/join", method="POST", data=clean_map(data)
-        ):
-            return True
+        await self.docker._query_discard(
+            "swarm/join",
+            method="POST",
+            data=encode_json(prune_none_inplace(data)),
+            headers={"Content-Type": "application/json"},
+        )
+        return True
 
     async def leave(self, *, force: bool = False) -> bool:
         """
@@ -114,5 +122,5 @@ class DockerSwarm:
 
         params = {"force": force}
 
-        async with self.docker._query("swarm/leave", method="POST", params=params):
-            return True
+        await self.docker._query_discard("swarm/leave", method="POST", params=params)
+        return True
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
-from typing import Mapping
+import asyncio
+import time
+from typing import Mapping, Optional, Tuple
 
 
 class DockerSystem:
     def __init__(self, docker) -> None:
         self.docker = docker
+        self._info_cache: Optional[Tuple[float, Mapping]] = None
+        # created lazily so that it binds to the running event loop
+        self._info_lock: Optional[asyncio.Lock] = None
 
     async def info(self) -> Mapping:
         """
@@ -18,3 +23,24 @@ class DockerSystem:
         response = await self.docker._query_json("info", method="GET")
 
         return response
+
+    async def info_cached(self, ttl: float = 5.0) -> Mapping:
+        """
+        Get system information like `info()`, reusing the last response
+        while it is younger than ``ttl`` seconds.
+
+        Concurrent callers share a single in-flight request.
+
+        Returns:
+            A dict with docker engine info.
+        """
+
+        if self._info_lock is None:
+            self._info_lock = asyncio.Lock()
+        async with self._info_lock:
+            cache = self._info_cache
+            if cache is not None and time.monotonic() - cache[0] < ttl:
+                return cache[1]
+            response = await self.info()
+            self._info_cache = (time.monotonic(), response)
+            return response
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, List, Mapping, Optional
+import asyncio
+from typing import Any, Dict, Iterable, List, Literal, Mapping, Optional, overload
 
 from .utils import clean_filters
 
@@ -9,12 +10,27 @@ class DockerTasks:
     def __init__(self, docker):
         self.docker = docker
 
-    async def list(self, *, filters: Optional[Mapping] = None) -> List[Mapping]:
+    @overload
+    async def list(
+        self, *, filters: Optional[Mapping] = None, hydrate: Literal[False] = False
+    ) -> List[Mapping]: ...
+
+    @overload
+    async def list(
+        self, *, filters: Optional[Mapping] = None, hydrate: Literal[True]
+    ) -> Dict[str, Mapping]: ...
+
+    async def list(
+        self, *, filters: Optional[Mapping] = None, hydrate: bool = False
+    ) -> Any:
         """
         Return a list of tasks
 
         Args:
             filters: a collection of filters
+            hydrate: return a dict of the tasks keyed by their ID instead.
+                The listed tasks carry the same fields as ``inspect()``
+                on current engines, so no per-task request is needed.
 
         Available filters:
         desired-state=(running | shutdown | accepted)
@@ -26,9 +42,11 @@ class DockerTasks:
 
         """
 
-        params = {"filters": clean_filters(filters)}
+        params = {} if filters is None else {"filters": clean_filters(filters)}
 
         response = await self.docker._query_json("tasks", method="GET", params=params)
+        if hydrate:
+            return {task["ID"]: task for task in response}
         return response
 
     async def inspect(self, task_id: str) -> Mapping[str, Any]:
@@ -42,3 +60,23 @@ class DockerTasks:
 
         response = await self.docker._query_json(f"tasks/{task_id}", method="GET")
         return response
+
+    async def inspect_many(
+        self, task_ids: Iterable[str], *, concurrency: int = 10
+    ) -> List[Mapping[str, Any]]:
+        """
+        Return info about several tasks, fetched concurrently
+
+        Args:
+            task_ids: IDs of the tasks
+            concurrency: maximum number of tasks inspected at the same time
+
+        """
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _inspect_one(task_id: str) -> Mapping[str, Any]:
+            async with semaphore:
+                return await self.inspect(task_id)
+
+        return list(await asyncio.gather(*map(_inspect_one, task_ids)))
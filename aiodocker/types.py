@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import enum
 import sys
 from typing import (
     TYPE_CHECKING,
+    Any,
     Mapping,
     Protocol,
     Sequence,
@@ -30,17 +30,23 @@ class SupportsRead(Protocol[_T_co]):
 # NOTE: Currently these types are used to annotate arguments only.
 # When returning values, we need extra type-narrowing for individual fields,
 # so it is better to define per-API typed DTOs.
-JSONValue: TypeAlias = Union[
-    str,
-    int,
-    float,
-    bool,
-    None,
-    Mapping[str, "JSONValue"],
-    Sequence["JSONValue"],
-]
-JSONObject: TypeAlias = Mapping[str, "JSONValue"]
-JSONList: TypeAlias = Sequence["JSONValue"]
+if TYPE_CHECKING:
+    JSONValue: TypeAlias = Union[
+        str,
+        int,
+        float,
+        bool,
+        None,
+        Mapping[str, "JSONValue"],
+        Sequence["JSONValue"],
+    ]
+    JSONObject: TypeAlias = Mapping[str, "JSONValue"]
+    JSONList: TypeAlias = Sequence["JSONValue"]
+else:
+    # the recursive aliases are only meaningful to type checkers
+    JSONValue = Any
+    JSONObject = Mapping[str, Any]
+    JSONList = Sequence[Any]
 
 
 class PortInfo(TypedDict):
@@ -48,8 +54,15 @@ class PortInfo(TypedDict):
     HostPort: str
 
 
-class Sentinel(enum.Enum):
-    TOKEN = enum.auto()
+class Sentinel:
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<SENTINEL>"
+
+    def __reduce__(self) -> str:
+        # copies and unpickled values resolve to the module singleton
+        return "SENTINEL"
 
 
-SENTINEL = Sentinel.TOKEN
+SENTINEL = Sentinel()
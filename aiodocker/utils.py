@@ -2,16 +2,21 @@ from __future__ import annotations
 
 import base64
 import codecs
+import functools
 import json
 import tarfile
 import tempfile
+from collections import deque
 from io import BytesIO
+from types import MappingProxyType
 from typing import (
     IO,
     Any,
+    Callable,
     Dict,
     Iterable,
     Mapping,
+    MutableMapping,
     Optional,
     Sequence,
     Tuple,
@@ -22,6 +27,12 @@ from typing import (
 from .types import JSONObject
 
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
 async def parse_result(response, response_type=None, *, encoding="utf-8"):
     """
     Convert the response to native objects by the given response type
@@ -52,7 +63,12 @@ async def parse_result(response, response_type=None, *, encoding="utf-8"):
         what = await response.read()
         return tarfile.open(mode="r", fileobj=BytesIO(what))
     if "json" == response_type:
-        data = await response.json(encoding=encoding)
+        if orjson is not None and encoding == "utf-8":
+            body = await response.read()
+            # an empty body decodes to None like ClientResponse.json()
+            data = orjson.loads(body) if body.strip() else None
+        else:
+            data = await response.json(encoding=encoding)
     elif "text" == response_type:
         data = await response.text(encoding=encoding)
     else:
@@ -60,11 +76,13 @@ async def parse_result(response, response_type=None, *, encoding="utf-8"):
     return data
 
 
+@functools.lru_cache(maxsize=128)
 def parse_content_type(ct: str) -> Tuple[str, str, Mapping[str, str]]:
     """
     Decompose the value of HTTP "Content-Type" header into
-    the main/sub MIME types and other extra options as a dictionary.
+    the main/sub MIME types and other extra options as a read-only mapping.
     All parsed values are lower-cased automatically.
+    Results are cached as responses repeat a handful of distinct values.
     """
     pieces = ct.split(";")
     try:
@@ -87,28 +105,37 @@ def parse_content_type(ct: str) -> Tuple[str, str, Mapping[str, str]]:
                 options[k.lower()] = v.lower()
     else:
         options = {}
-    return main_type.lower(), sub_type.lower(), options
+    return main_type.lower(), sub_type.lower(), MappingProxyType(options)
 
 
 def identical(d1, d2):
-    if type(d1) != type(d2):
-        return False
+    # walk both trees with an explicit stack instead of recursing
+    stack = deque([(d1, d2)])
+    while stack:
+        d1, d2 = stack.pop()
+        if d1 is d2:
+            # shared subtrees need no inspection
+            continue
+        t = type(d1)
+        if t is not type(d2):
+            return False
 
-    if isinstance(d1, dict):
-        keys = set(d1.keys()) | set(d2.keys())
-        for key in keys:
-            if not identical(d1.get(key, {}), d2.get(key, {})):
+        # JSON documents only hold plain dicts and lists
+        if t is dict:
+            if d1.keys() == d2.keys():
+                stack.extend(zip(d1.values(), map(d2.__getitem__, d1)))
+            else:
+                # a key missing on one side compares as an empty dict
+                keys = d1.keys() | d2.keys()
+                stack.extend((d1.get(key, {}), d2.get(key, {})) for key in keys)
+        elif t is list:
+            if len(d1) != len(d2):
                 return False
-        return True
-
-    if isinstance(d1, list):
-        if len(d1) != len(d2):
+            stack.extend(zip(d1, d2))
+        elif d1 != d2:
             return False
 
-        pairs = zip(d1, d2)
-        return all(identical(x, y) for (x, y) in pairs)
-
-    return d1 == d2
+    return True
 
 
 _true_strs = frozenset(["true", "yes", "y", "1"])
@@ -126,17 +153,26 @@ def human_bool(s) -> bool:
         return bool(s)
 
 
+_bool_strs = {True: "1", False: "0"}
+
+
 def httpize(d: Optional[JSONObject]) -> Optional[Mapping[str, str]]:
     if d is None:
         return None
-    converted = {}
-    for k, v in d.items():
-        if isinstance(v, bool):
-            v = "1" if v else "0"
-        if not isinstance(v, str):
-            v = json.dumps(v)
-        converted[k] = v
-    return converted
+    return {
+        k: (
+            _bool_strs[v]
+            if type(v) is bool
+            else v if isinstance(v, str) else json.dumps(v)
+        )
+        for k, v in d.items()
+    }
+
+
+@functools.lru_cache(maxsize=128)
+def _incremental_decoder(encoding: str) -> Callable[..., codecs.IncrementalDecoder]:
+    # log streams only ever use a couple of encodings
+    return codecs.getincrementaldecoder(encoding)
 
 
 class _DecodeHelper:
@@ -146,7 +182,7 @@ class _DecodeHelper:
 
     def __init__(self, generator, encoding):
         self._gen = generator.__aiter__()
-        self._decoder = codecs.getincrementaldecoder(encoding)(errors="ignore")
+        self._decoder = _incremental_decoder(encoding)(errors="ignore")
         self._flag = False
 
     def __aiter__(self):
@@ -179,6 +215,30 @@ def clean_map(obj: Mapping[Any, Any]) -> Mapping[Any, Any]:
     return {k: v for k, v in obj.items() if v is not None}
 
 
+def prune_none_inplace(obj: MutableMapping[Any, Any]) -> MutableMapping[Any, Any]:
+    """
+    Remove the keys with ``None`` values from the given MutableMapping object
+    in place and return it.
+    """
+    for k in [k for k, v in obj.items() if v is None]:
+        del obj[k]
+    return obj
+
+
+def encode_json(obj: Any, *, sort_keys: bool = False) -> bytes:
+    """
+    Serialize ``obj`` into UTF-8 encoded JSON bytes.
+    Uses orjson if it is installed and falls back to the stdlib json module.
+    """
+    if orjson is not None:
+        # like the stdlib, accept and stringify non-str dict keys
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, sort_keys=sort_keys).encode("utf-8")
+
+
 def format_env(key, value: Union[None, bytes, str]) -> str:
     """
     Formats envs from {key:value} to ['key=value']
@@ -203,12 +263,7 @@ def clean_networks(
     if not isinstance(networks, list):
         raise TypeError("networks parameter must be a list.")
 
-    result = []
-    for n in networks:
-        if isinstance(n, str):
-            n = {"Target": n}
-        result.append(n)
-    return result
+    return [{"Target": n} if isinstance(n, str) else n for n in networks]
 
 
 def clean_filters(filters: Optional[Mapping[str, Any] | Sequence[str]] = None) -> str:
@@ -220,14 +275,12 @@ def clean_filters(filters: Optional[Mapping[str, Any] | Sequence[str]] = None) -
     """
     if filters is None:
         return "{}"
-    if isinstance(filters, dict):
-        for k, v in filters.items():
-            if not isinstance(v, list):
-                v = [v]
-            filters[k] = v
-    else:
+    if not isinstance(filters, dict):
         raise TypeError("filters must be a mapping")
-    return json.dumps(filters)
+    # build a new mapping instead of rewriting the caller's filters
+    return json.dumps({
+        k: v if isinstance(v, list) else [v] for k, v in filters.items()
+    })
 
 
 def mktar_from_dockerfile(fileobj: Union[BytesIO, IO[bytes]]) -> IO[bytes]:
@@ -241,11 +294,13 @@ def mktar_from_dockerfile(fileobj: Union[BytesIO, IO[bytes]]) -> IO[bytes]:
     """
 
     f = tempfile.NamedTemporaryFile()
-    t = tarfile.open(mode="w:gz", fileobj=f)
+    # the archive is written front to back, so a streaming writer suffices
+    t = tarfile.open(mode="w|gz", fileobj=f)
 
     if isinstance(fileobj, BytesIO):
         dfinfo = tarfile.TarInfo("Dockerfile")
-        dfinfo.size = len(fileobj.getvalue())
+        with fileobj.getbuffer() as buf:
+            dfinfo.size = buf.nbytes
         fileobj.seek(0)
     else:
         dfinfo = t.gettarinfo(fileobj=fileobj, arcname="Dockerfile")
@@ -281,7 +336,7 @@ def compose_auth_header(
         else:
             if registry_addr:
                 auth2["serveraddress"] = registry_addr
-        auth_json = json.dumps(auth2).encode("utf-8")
+        auth_json = encode_json(auth2)
     elif isinstance(auth, (str, bytes)):
         # Parse simple "username:password"-formatted strings
         # and attach the server address specified.
@@ -295,7 +350,7 @@ def compose_auth_header(
             "email": None,
             "serveraddress": registry_addr,
         }
-        auth_json = json.dumps(config).encode("utf-8")
+        auth_json = encode_json(config)
     else:
         raise TypeError("auth must be base64 encoded string/bytes or a dictionary")
     return base64.b64encode(auth_json).decode("ascii")
@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-import json
-
-from .utils import clean_filters
+from .utils import clean_filters, encode_json
 
 
 class DockerVolumes:
@@ -32,7 +30,7 @@ class DockerVolumes:
         return DockerVolume(self.docker, data["Name"])
 
     async def create(self, config):
-        config = json.dumps(config, sort_keys=True).encode("utf-8")
+        config = encode_json(config, sort_keys=True)
         data = await self.docker._query_json(
             "volumes/create", method="POST", data=config
         )
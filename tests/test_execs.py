@@ -1,4 +1,5 @@
 import asyncio
+import struct
 import sys
 from typing import List
 
@@ -7,7 +8,8 @@ from async_timeout import timeout
 
 from aiodocker.containers import DockerContainer
 from aiodocker.docker import Docker
-from aiodocker.execs import Stream
+from aiodocker.execs import Exec, Stream
+from aiodocker.stream import Message, _ExecParser, _MessageQueue
 
 
 async def expect_prompt(stream: Stream) -> bytes:
@@ -180,3 +182,100 @@ async def test_exec_restore_tty_detached(
     exec2 = docker.containers.exec(exec1.id)
     await exec2.start(detach=True)
     assert exec2._tty
+
+
+class _FakeQueue:
+    def __init__(self) -> None:
+        self.messages: List[Message] = []
+
+    def feed_data(self, msg: Message, size: int) -> None:
+        assert len(msg.data) == size
+        self.messages.append(msg)
+
+
+def _frame(stream: int, data: bytes) -> bytes:
+    return struct.pack(">BxxxL", stream, len(data)) + data
+
+
+def test_exec_parser_multiplexed() -> None:
+    queue = _FakeQueue()
+    parser = _ExecParser(queue, tty=False)
+    payload = b"".join([
+        _frame(1, b"Hello"),
+        _frame(2, b"Oops"),
+        _frame(1, b""),
+        _frame(1, b"x" * 70000),
+        _frame(2, b"tail"),
+    ])
+    # feed in uneven chunks that split both headers and payloads
+    for i in range(0, len(payload), 3001):
+        parser.feed_data(payload[i : i + 3001])
+    stdout = b"".join(msg.data for msg in queue.messages if msg.stream == 1)
+    stderr = b"".join(msg.data for msg in queue.messages if msg.stream == 2)
+    assert stdout == b"Hello" + b"x" * 70000
+    assert stderr == b"Oopstail"
+    assert not parser._buf
+
+
+def test_exec_parser_coalesces_frames() -> None:
+    queue = _FakeQueue()
+    parser = _ExecParser(queue, tty=False)
+    parser.feed_data(
+        b"".join([
+            _frame(1, b"a"),
+            _frame(1, b"b"),
+            _frame(2, b"c"),
+            _frame(1, b"d"),
+            _frame(1, b"e"),
+        ])
+    )
+    assert queue.messages == [
+        Message(1, b"ab"),
+        Message(2, b"c"),
+        Message(1, b"de"),
+    ]
+
+
+def test_exec_parser_tty() -> None:
+    queue = _FakeQueue()
+    parser = _ExecParser(queue, tty=True)
+    parser.feed_data(b"\x01\x00raw")
+    assert queue.messages == [Message(1, b"\x01\x00raw")]
+
+
+class _FakeProtocol:
+    def __init__(self) -> None:
+        self._reading_paused = False
+
+    def pause_reading(self) -> None:
+        self._reading_paused = True
+
+    def resume_reading(self) -> None:
+        self._reading_paused = False
+
+
+@pytest.mark.asyncio
+async def test_message_queue_flow_control() -> None:
+    protocol = _FakeProtocol()
+    queue = _MessageQueue(protocol, 4)  # type: ignore[arg-type]
+    reader = asyncio.ensure_future(queue.read())
+    await asyncio.sleep(0)
+    queue.feed_data(Message(1, b"abcde"), 5)
+    assert await reader == Message(1, b"abcde")
+
+    queue.feed_data(Message(1, b"x" * 9), 9)
+    assert protocol._reading_paused
+    assert await queue.read() == Message(1, b"x" * 9)
+    assert not protocol._reading_paused
+
+    queue.feed_eof()
+    assert await queue.read() is None
+
+
+def test_stream_queue_limit_passed_through() -> None:
+    docker: Docker = None  # type: ignore[assignment]
+    stream = Exec(docker, "abc", tty=False).start(queue_limit=1024)
+    assert stream._queue_limit == 1024
+    stream = DockerContainer(docker, id="abc").attach(stdout=True, queue_limit=2048)
+    assert stream._queue_limit == 2048
+    assert Exec(docker, "abc", tty=False).start()._queue_limit is None
@@ -3,6 +3,8 @@ import asyncio
 import pytest
 from async_timeout import timeout
 
+from aiodocker.exceptions import DockerError
+
 
 TaskTemplate = {"ContainerSpec": {"Image": "python"}}
 
@@ -35,6 +37,24 @@ async def test_service_list_with_filter(swarm, tmp_service):
     assert len(filtered_list) == 1
 
 
+@pytest.mark.asyncio
+async def test_service_create_reused_env_template(swarm, random_name):
+    task_template = {"ContainerSpec": {"Image": "python", "Env": {"FOO": "bar"}}}
+    service_ids = []
+    try:
+        for _ in range(2):
+            service = await swarm.services.create(
+                task_template=task_template, name=random_name()
+            )
+            service_ids.append(service["ID"])
+        assert task_template["ContainerSpec"]["Env"] == ["FOO=bar"]
+        spec = await swarm.services.inspect(service_ids[-1])
+        assert spec["Spec"]["TaskTemplate"]["ContainerSpec"]["Env"] == ["FOO=bar"]
+    finally:
+        for service_id in service_ids:
+            await swarm.services.delete(service_id)
+
+
 @pytest.mark.asyncio
 async def test_service_tasks_list(swarm, tmp_service):
     tasks = await swarm.tasks.list()
@@ -43,6 +63,22 @@ async def test_service_tasks_list(swarm, tmp_service):
     assert await swarm.tasks.inspect(tasks[0]["ID"])
 
 
+@pytest.mark.asyncio
+async def test_service_tasks_list_hydrate(swarm, tmp_service):
+    tasks = await swarm.tasks.list(filters={"service": tmp_service}, hydrate=True)
+    assert len(tasks) == 1
+    task_id, task = next(iter(tasks.items()))
+    assert task["ID"] == task_id
+    assert task["ServiceID"] == tmp_service
+
+
+@pytest.mark.asyncio
+async def test_service_tasks_inspect_many(swarm, tmp_service):
+    tasks = await swarm.tasks.list(filters={"service": tmp_service})
+    inspected = await swarm.tasks.inspect_many([task["ID"] for task in tasks])
+    assert [task["ID"] for task in inspected] == [task["ID"] for task in tasks]
+
+
 @pytest.mark.asyncio
 async def test_service_tasks_list_with_filters(swarm, tmp_service):
     tasks = await swarm.tasks.list(filters={"service": tmp_service})
@@ -156,6 +192,62 @@ async def test_service_update(swarm):
     await swarm.services.delete(name)
 
 
+@pytest.mark.asyncio
+async def test_service_bulk_update(swarm, random_name):
+    initial_image = "python:3.6.1"
+    image_after_update = "python:3.7.4"
+    TaskTemplate = {"ContainerSpec": {"Image": initial_image}}
+
+    names = [random_name() for _ in range(3)]
+    for name in names:
+        await swarm.services.create(name=name, task_template=TaskTemplate)
+    try:
+        results = await swarm.services.bulk_update(
+            dict.fromkeys(names, image_after_update), concurrency=2
+        )
+        assert results == dict.fromkeys(names)
+        for name in names:
+            service = await swarm.services.inspect(name)
+            current_image = service["Spec"]["TaskTemplate"]["ContainerSpec"]["Image"]
+            assert image_after_update in current_image
+    finally:
+        for name in names:
+            await swarm.services.delete(name)
+
+
+@pytest.mark.asyncio
+async def test_service_bulk_update_versions(swarm, random_name):
+    initial_image = "python:3.6.1"
+    image_after_update = "python:3.7.4"
+    TaskTemplate = {"ContainerSpec": {"Image": initial_image}}
+
+    names = [random_name() for _ in range(2)]
+    for name in names:
+        await swarm.services.create(name=name, task_template=TaskTemplate)
+    try:
+        images = dict.fromkeys(names, image_after_update)
+        versions = {}
+        for name in names:
+            service = await swarm.services.inspect(name)
+            versions[name] = service["Version"]["Index"]
+
+        with pytest.raises(ValueError):
+            await swarm.services.bulk_update(images, versions={names[0]: 1})
+
+        # a stale version fails only that service's update
+        stale = {**versions, names[1]: versions[names[1]] - 1}
+        results = await swarm.services.bulk_update(images, versions=stale)
+        assert results[names[0]] is None
+        assert isinstance(results[names[1]], DockerError)
+
+        service = await swarm.services.inspect(names[0])
+        current_image = service["Spec"]["TaskTemplate"]["ContainerSpec"]["Image"]
+        assert image_after_update in current_image
+    finally:
+        for name in names:
+            await swarm.services.delete(name)
+
+
 @pytest.mark.asyncio
 async def test_service_update_error(swarm):
     name = "service-update"
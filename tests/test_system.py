@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from aiodocker.docker import Docker
@@ -8,3 +10,13 @@ async def test_system_info(docker: Docker) -> None:
     docker_info = await docker.system.info()
     assert "ID" in docker_info
     assert "ServerVersion" in docker_info
+
+
+@pytest.mark.asyncio
+async def test_system_info_cached(docker: Docker) -> None:
+    first, second = await asyncio.gather(
+        docker.system.info_cached(), docker.system.info_cached()
+    )
+    assert first is second
+    assert "ServerVersion" in first
+    assert await docker.system.info_cached(ttl=0) is not first
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import base64
+import copy
 import json
+import pickle
 from typing import Any, Dict, Sequence
 
 import pytest
 
 from aiodocker import utils
+from aiodocker.types import SENTINEL
 
 
 def test_clean_mapping() -> None:
@@ -15,6 +19,13 @@ def test_clean_mapping() -> None:
     assert result == clean_dict
 
 
+def test_prune_none_inplace() -> None:
+    dirty_dict: Dict[Any, Any] = {"a": None, "b": {}, "c": [], "d": 1}
+    result = utils.prune_none_inplace(dirty_dict)
+    assert result is dirty_dict
+    assert result == {"b": {}, "c": [], "d": 1}
+
+
 def test_parse_content_type() -> None:
     ct = "text/plain"
     mt, st, opts = utils.parse_content_type(ct)
@@ -27,6 +38,10 @@ def test_parse_content_type() -> None:
     assert mt == "text"
     assert st == "plain"
     assert opts == {"charset": "utf-8"}
+    # parsed values are cached, so the options must not be mutable
+    assert utils.parse_content_type(ct)[2] is opts
+    with pytest.raises(TypeError):
+        opts["charset"] = "ascii"  # type: ignore[index]
 
     ct = "text/plain; "
     mt, st, opts = utils.parse_content_type(ct)
@@ -39,6 +54,92 @@ def test_parse_content_type() -> None:
         mt, st, opts = utils.parse_content_type(ct)
 
 
+@pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+def test_encode_json(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(utils, "orjson", None)
+    elif utils.orjson is None:
+        pytest.skip("orjson is not installed")
+    data = {"b": [1, "\u2603"], "a": None}
+    encoded = utils.encode_json(data)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == data
+    assert utils.encode_json(data, sort_keys=True).startswith(b'{"a":')
+    # non-str keys are stringified the same way regardless of the backend
+    numbered = {2: "x", 1: {3: True}}
+    expected = {"2": "x", "1": {"3": True}}
+    assert json.loads(utils.encode_json(numbered)) == expected
+    assert json.loads(utils.encode_json(numbered, sort_keys=True)) == expected
+
+
+def test_identical() -> None:
+    config = {"Image": "busybox", "Cmd": ["sh", "-c"], "Labels": {"a": "1"}}
+    assert utils.identical(config, config)
+    assert utils.identical(config, {**config, "Labels": {"a": "1"}})
+    assert not utils.identical(config, {**config, "Cmd": ["sh"]})
+    assert not utils.identical(config, {**config, "Labels": {"a": 1}})
+    assert not utils.identical([1, 2], (1, 2))
+    # a missing key is the same as an empty dict
+    assert utils.identical({"Volumes": {}}, {})
+    assert not utils.identical({"Volumes": None}, {})
+
+    def nested(leaf: Any) -> Dict[str, Any]:
+        tree: Dict[str, Any] = {"leaf": leaf}
+        for _ in range(2000):
+            tree = {"x": [tree]}
+        return tree
+
+    # separately built trees are walked down to the leaves
+    assert utils.identical(nested(1), nested(1))
+    assert not utils.identical(nested(1), nested(2))
+
+
+def test_httpize() -> None:
+    assert utils.httpize(None) is None
+    assert utils.httpize({"a": True, "b": False, "c": "x", "d": 1, "e": [1]}) == {
+        "a": "1",
+        "b": "0",
+        "c": "x",
+        "d": "1",
+        "e": "[1]",
+    }
+
+
+class _FakeResponse:
+    def __init__(self, body: bytes) -> None:
+        self.headers = {"content-type": "application/json"}
+        self._body = body
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def json(self, *, encoding: str) -> Any:
+        return json.loads(self._body.decode(encoding)) if self._body else None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+async def test_parse_result_json(
+    monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(utils, "orjson", None)
+    elif utils.orjson is None:
+        pytest.skip("orjson is not installed")
+    body = b'{"Id": "abc", "Names": ["/\\u2603"]}'
+    assert await utils.parse_result(_FakeResponse(body)) == json.loads(body)
+    assert await utils.parse_result(_FakeResponse(b"")) is None
+
+
+def test_compose_auth_header() -> None:
+    auth = {"username": "user", "password": "pass"}
+    header = utils.compose_auth_header(auth, "registry.example.com")
+    assert json.loads(base64.b64decode(header)) == {
+        **auth,
+        "serveraddress": "registry.example.com",
+    }
+
+
 def test_format_env() -> None:
     assert utils.format_env("name", "hello") == "name=hello"
     assert utils.format_env("name", None) == "name"
@@ -63,8 +164,15 @@ def test_clean_filters() -> None:
     filters = {"a": ["1", "2", "3", "4"], "b": "string"}
     result = {"a": ["1", "2", "3", "4"], "b": ["string"]}
     assert utils.clean_filters(filters=filters) == json.dumps(result)
+    assert filters["b"] == "string"
     assert utils.clean_filters(filters={}) == "{}"
     assert utils.clean_filters(filters=None) == "{}"
 
     with pytest.raises(TypeError):
         assert utils.clean_filters(filters=())
+
+
+def test_sentinel_identity() -> None:
+    assert copy.copy(SENTINEL) is SENTINEL
+    assert copy.deepcopy(SENTINEL) is SENTINEL
+    assert pickle.loads(pickle.dumps(SENTINEL)) is SENTINEL